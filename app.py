@@ -1,22 +1,57 @@
-import base64
+import atexit
+import hashlib
+import html
 import os
 import io
+import json
+import posixpath
 import re
 import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
 from abc import ABC, abstractmethod
 import streamlit as st
 import pandas as pd
 from docx import Document
 from docx.oxml.ns import qn
+from lxml import etree
 from pymongo import MongoClient
-from PIL import Image
+from pymongo.errors import BulkWriteError, OperationFailure
+from pymongo.write_concern import WriteConcern
+from PIL import Image, ImageOps
 import cloudinary
 import cloudinary.uploader
+import cloudinary.utils
+from cloudinary.exceptions import RateLimited
 
 
 # ==================== DATABASE LAYER ====================
 
+@st.cache_resource(show_spinner=False)
+def _get_mongo_client(mongo_uri):
+    """
+    Streamlit her rerun'da script'i baştan çalıştırır; sınıf düzeyindeki singleton
+    da sıfırlanır. İstemci ve bağlantı havuzu bu yüzden süreç boyunca burada tutulur.
+    """
+    client = MongoClient(
+        mongo_uri,
+        minPoolSize              = 4,
+        maxPoolSize              = 16,
+        maxIdleTimeMS            = 300_000,   # 5 dk boşta kalan bağlantı kapatılır
+        retryWrites              = True,
+        serverSelectionTimeoutMS = 3000,
+        connectTimeoutMS         = 2000,
+        compressors              = "zstd,zlib",
+    )
+    try:
+        # Topology discovery + TLS + auth ilk kullanıcı sorgusunu beklemesin
+        client.admin.command("ping")
+    except Exception:
+        pass
+    return client
+
+
 class DatabaseConnection:
     _instance = None
     _client = None
@@ -33,7 +68,7 @@ class DatabaseConnection:
             if not mongo_uri:
                 st.error("MONGO_URI secret'ı tanımlı değil.")
                 st.stop()
-            self._client = MongoClient(mongo_uri)
+            self._client = _get_mongo_client(mongo_uri)
         return self._client
 
     @property
@@ -59,16 +94,135 @@ class EserlerRepository(BaseRepository):
         return "eserler"
 
     def insert_many(self, eserler):
-        BATCH_SIZE = 5000
+        """
+        Eserleri sırasız (ordered=False) toplu ekle; eklenen kayıt sayısını döndür.
+        Hatalı bir kayıt batch'in geri kalanını durdurmaz.
+        """
+        # Sunucunun tek batch'te kabul ettiği azami yazma sayısı;
+        # 48MB mesaj sınırına göre bölmeyi pymongo kendisi yapar.
+        BATCH_SIZE = 100_000
+        # Toplu yüklemede replikasyon / journal onayı beklenmez; w=1 ile eklenen
+        # sayısı ve kayıt hataları yine de sunucudan döner (w=0 bunları kaybeder).
+        koleksiyon = self.collection.with_options(
+            write_concern=WriteConcern(w=1, j=False)
+        )
+        eklenen = 0
         for i in range(0, len(eserler), BATCH_SIZE):
-            self.collection.insert_many(eserler[i:i + BATCH_SIZE])
-
-    def search(self, query):
-        # satis_fiyati UI'da gösterilmez
-        return list(self.collection.find(query, {"satis_fiyati": 0}))
+            batch = eserler[i:i + BATCH_SIZE]
+            try:
+                koleksiyon.insert_many(
+                    batch, ordered=False, bypass_document_validation=True
+                )
+                eklenen += len(batch)
+            except BulkWriteError as e:
+                eklenen += e.details.get("nInserted", 0)
+        return eklenen
+
+    def delete_by_ids(self, eser_idler):
+        """Verilen _id'lere sahip eserleri sil; silinen kayıt sayısını döndür."""
+        if not eser_idler:
+            return 0
+        return self.collection.delete_many({"_id": {"$in": list(eser_idler)}}).deleted_count
+
+    # Liste görünümünde kullanılan alanlar; _id detay için anahtar olarak taşınır
+    LISTE_ALANLARI = {"lot_no": 1, "eser_adi": 1, "sanatci": 1, "sahip": 1}
+
+    # Detay penceresinde kullanılan alanlar; satis_fiyati UI'da gösterilmez
+    GORUNUM_ALANLARI = {
+        "_id": 0, "lot_no": 1, "eser_adi": 1, "sanatci": 1, "sahip": 1,
+        "detay": 1, "gorsel_url": 1, "dosya_adi": 1,
+    }
+
+    def search_summary(self, query, limit=0):
+        """
+        Sorguya uyan eserlerin yalnızca liste alanları için cursor döndür.
+        limit=0 → sınırsız; aksi halde sınır MongoDB tarafında uygulanır.
+        """
+        cursor = self.collection.find(query, self.LISTE_ALANLARI)
+        if "$text" in query:
+            # Limit kesiyorsa en alakalı eşleşmeler kalsın
+            cursor = cursor.sort([("score", {"$meta": "textScore"})])
+        elif not query:
+            # Filtresiz açılışta en son eklenenler; sıralama _id index'inden okunur
+            cursor = cursor.sort("_id", -1)
+        return cursor.limit(limit).batch_size(500)
+
+    def get_detail(self, eser_id):
+        """Tek bir eserin detay penceresinde gösterilen tüm alanları."""
+        # lot_no dosyalar arasında tekrar edebildiği için _id ile okunur
+        return self.collection.find_one({"_id": eser_id}, self.GORUNUM_ALANLARI)
 
     def get_distinct_sanatcilar(self):
-        return sorted(self.collection.distinct("sanatci", {"sanatci": {"$ne": ""}}))
+        # Gruplama ve sıralama sunucuda yapılır; Python tarafında sorted() gerekmez.
+        # Türkçe collation: Ç, Ğ, İ, Ö, Ş, Ü kendi harflerinin yanında, yabancı ve
+        # aksanlı harfler de (é, ñ, w, x) Latin sırasında yerini alır. Liste doküman
+        # sayısına göre 300 sn cache'lendiğinden collation'lı tarama nadiren çalışır.
+        pipeline = [
+            {"$match": {"sanatci": {"$ne": ""}}},
+            {"$group": {"_id": "$sanatci"}},
+            {"$sort":  {"_id": 1}},
+        ]
+        return [
+            d["_id"]
+            for d in self.collection.aggregate(
+                pipeline, allowDiskUse=True, collation={"locale": "tr"}
+            )
+        ]
+
+    def estimated_count(self):
+        # Koleksiyon metadata'sından okunur; doküman taranmaz
+        return self.collection.estimated_document_count()
+
+    def ensure_indexes(self):
+        indexler = [
+            # Lot No araması ve sanatçı filtresi için; (sanatci, lot_no) sanatçı
+            # gruplamasını da karşılar, ayrı bir sanatci index'ine gerek kalmaz.
+            ([("lot_no", 1)], {}),
+            ([("sanatci", 1), ("lot_no", 1)], {}),
+            # ^prefix yedek araması için alan index'i eklenmez: $options "i" regex'i
+            # index sınırı kullanamaz, index'in tamamını tarar; ek index'ler ise her
+            # katalog eklemesini yavaşlatır. Kelime aramaları text index'ten gider.
+            # Arama alanları için tek bir text index (koleksiyon başına en fazla bir tane olabilir)
+            (
+                [("eser_adi", "text"), ("sanatci", "text"), ("sahip", "text"), ("detay", "text")],
+                {"name": "eser_text_idx", "default_language": "turkish"},
+            ),
+        ]
+        for keys, secenekler in indexler:
+            try:
+                self.collection.create_index(keys, **secenekler)
+            except OperationFailure:
+                # Aynı alanlarda farklı seçeneklerle var olan index uygulamayı durdurmasın
+                pass
+
+
+@st.cache_resource(show_spinner=False)
+def _ensure_indexes(_eserler_repo):
+    """
+    Index'leri süreç başına bir kez, arka plan thread'inde oluştur; create_index
+    zaten idempotent. Dolu koleksiyonda index kurulumu sayfa çizimini bekletmez.
+    Sonuç Future olarak döner; hata olursa çağıran taraf önbelleği temizler.
+    """
+    executor = ThreadPoolExecutor(max_workers=1)
+    gorev    = executor.submit(_eserler_repo.ensure_indexes)
+    executor.shutdown(wait=False)
+    return gorev
+
+
+@st.cache_data(ttl=60, max_entries=128, show_spinner=False)
+def _cached_search(query_json: str, limit: int = 0) -> list:
+    """Aynı sorgu TTL içinde tekrar gelirse MongoDB'ye gitmeden bellekten döner."""
+    # st.cache_data sonucu pickle'lar; cursor burada tek seferde tüketilir
+    return list(EserlerRepository().search_summary(json.loads(query_json), limit))
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_sanatcilar(count_key: int) -> list:
+    """
+    count_key → koleksiyonun tahmini doküman sayısı. Başka bir oturum eser
+    eklediğinde sayı değişir ve liste TTL dolmadan yenilenir.
+    """
+    return EserlerRepository().get_distinct_sanatcilar()
 
 
 class AyarlarRepository(BaseRepository):
@@ -82,19 +236,32 @@ class AyarlarRepository(BaseRepository):
         return ayar["sifre"]
 
 
+@st.cache_resource(show_spinner=False)
+def _log_executor():
+    """Log yazımları için süreç boyunca tek bir arka plan thread'i."""
+    executor = ThreadPoolExecutor(max_workers=1)
+    atexit.register(executor.shutdown)
+    return executor
+
+
 class LogRepository(BaseRepository):
     def get_collection_name(self):
         return "ziyaretci_loglari"
 
     def log_login_attempt(self, entered_code, success):
+        # IP ve session bilgisi script context'i gerektirir; kayıt burada hazırlanır,
+        # yazma işlemi arka planda yapılır ve giriş yanıtını bekletmez.
+        kayit = {
+            "ip_adresi":     self._get_ip_address(),
+            "girilen_sifre": entered_code,
+            "basarili":      success,
+            "tarih_saat":    datetime.now(),
+            "session_id":    self._get_session_id(),
+        }
+        # Sonucu bekleyen yok; onaysız (w=0) yazım arka plan kuyruğunu hızlı boşaltır
+        koleksiyon = self.collection.with_options(write_concern=WriteConcern(w=0))
         try:
-            self.collection.insert_one({
-                "ip_adresi":     self._get_ip_address(),
-                "girilen_sifre": entered_code,
-                "basarili":      success,
-                "tarih_saat":    datetime.now(),
-                "session_id":    self._get_session_id(),
-            })
+            _log_executor().submit(koleksiyon.insert_one, kayit)
         except Exception:
             pass
 
@@ -179,15 +346,35 @@ class SessionManager:
         return timedelta(hours=cls.TIMEOUT_HOURS) - (datetime.now() - st.session_state.login_time)
 
 
+@st.cache_resource(show_spinner=False)
+def _cloudinary_http(maxsize: int):
+    """
+    Cloudinary yüklemeleri için süreç boyunca tek urllib3 havuzu.
+    SDK'nın paylaşılan havuzu host başına tek bağlantı saklar; paralel yüklemelerde
+    fazlası kapatılır ve her yüklemede yeniden TLS el sıkışması olur. Rerun'larda
+    yeni havuz kurulup eskisi sızdırılmasın diye burada önbelleklenir.
+    """
+    return cloudinary.utils.get_http_connector(
+        cloudinary.config(), dict(cloudinary.CERT_KWARGS, maxsize=maxsize)
+    )
+
+
 class CloudinaryService:
     """
     Cloudinary görsel yükleme servisi.
     Secrets: CLOUDINARY_CLOUD_NAME, CLOUDINARY_API_KEY, CLOUDINARY_API_SECRET
     """
     _configured = False
+    MAX_GENISLIK = 800   # Yüklenen görsellerin azami genişliği (px)
+    MAX_DENEME   = 3     # Hız sınırına takılan yükleme için deneme sayısı
+    HTTP_HAVUZ_BOYUTU = 16   # Cloudinary'e açık tutulan keep-alive bağlantı sayısı
 
     @classmethod
     def _configure(cls):
+        """
+        Yüklemeler başlamadan script thread'inde bir kez çağrılır (upload_images);
+        worker thread'ler paylaşılan SDK durumunu değiştirmez.
+        """
         if cls._configured:
             return
         cloudinary.config(
@@ -196,24 +383,72 @@ class CloudinaryService:
             api_secret = st.secrets["CLOUDINARY_API_SECRET"],
             secure     = True,
         )
+        # DİKKAT: uploader._http SDK'nın özel (private) modül değişkenidir; public bir
+        # havuz ayarı olmadığı için değiştiriliyor. SDK sürümü yükseltilirken kontrol edilmeli.
+        cloudinary.uploader._http = _cloudinary_http(cls.HTTP_HAVUZ_BOYUTU)
         cls._configured = True
 
+    @classmethod
+    def _resize(cls, image_bytes: bytes) -> bytes:
+        """
+        Görseli MAX_GENISLIK'e küçültüp WEBP (kalite 80) olarak yeniden kodla.
+        Küçük görseller sadece yeniden kodlanır; sonuç orijinalden büyükse
+        orijinal byte'lar döner. Geniş görseller her durumda küçültülmüş döner;
+        okunamayan görseller (EMF/WMF vb.) upload'daki sunucu sınırına kalır.
+        """
+        try:
+            img = Image.open(io.BytesIO(image_bytes))
+            # Yeniden kodlanan WEBP EXIF taşımaz; yönlendirme pikselere uygulanmazsa
+            # dikey fotoğraflar yan yatık görünür (Cloudinary orijinali EXIF'ten döndürürdü)
+            img = ImageOps.exif_transpose(img)
+            genis = img.width > cls.MAX_GENISLIK
+            if genis:
+                img.thumbnail((cls.MAX_GENISLIK, 10_000), Image.LANCZOS)
+            saydam = img.mode in ("RGBA", "LA", "PA") or "transparency" in img.info
+            buf = io.BytesIO()
+            img.convert("RGBA" if saydam else "RGB").save(buf, format="WEBP", quality=80, method=4)
+            if not genis and buf.tell() >= len(image_bytes):
+                return image_bytes
+            return buf.getvalue()
+        except Exception:
+            return image_bytes
+
     @classmethod
     def upload(cls, image_bytes: bytes, public_id: str) -> str:
         """
         Görsel byte'larını Cloudinary'e yükle, URL döndür.
         public_id → tekrar yüklenirse üzerine yazar (idempotent).
+        Büyük görseller yüklemeden önce yerelde küçültülür; orijinaller ağa çıkmaz.
+        Hız sınırı (HTTP 420/429) yanıtlarında üstel bekleme ile MAX_DENEME kez denenir.
         """
-        cls._configure()
-        result = cloudinary.uploader.upload(
-            image_bytes,
-            public_id      = public_id,
-            overwrite      = True,
-            resource_type  = "image",
-            folder         = "muzayede",
-            transformation = [{"width": 800, "crop": "limit", "quality": "auto"}],
-        )
-        return result["secure_url"]
+        payload = cls._resize(image_bytes)
+        for deneme in range(cls.MAX_DENEME):
+            try:
+                result = cloudinary.uploader.upload(
+                    payload,
+                    public_id      = public_id,
+                    overwrite      = True,
+                    resource_type  = "image",
+                    folder         = "muzayede",
+                    # Yerelde küçültülemeyen görseller için güvenlik sınırı;
+                    # zaten MAX_GENISLIK altındaki görsellerde etkisizdir
+                    transformation = [{"width": cls.MAX_GENISLIK, "crop": "limit"}],
+                )
+                return result["secure_url"]
+            except RateLimited:
+                if deneme == cls.MAX_DENEME - 1:
+                    raise
+                time.sleep(0.5 * 2 ** deneme)
+
+    @staticmethod
+    def delivery_url(url: str, transformation: str = "f_auto,q_auto") -> str:
+        """
+        Cloudinary teslim URL'ine dönüşüm ekle (…/image/upload/f_auto,q_auto/…).
+        f_auto → tarayıcının desteklediği en küçük format (WebP/AVIF) sunulur.
+        """
+        if "/image/upload/" not in url:
+            return url
+        return url.replace("/image/upload/", f"/image/upload/{transformation}/", 1)
 
 
 class MuzayedeParser:
@@ -234,94 +469,194 @@ class MuzayedeParser:
     """
 
     _BLIP_ATTR = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed'
+    _REL_NS    = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+    _OFFICE_DOCUMENT_REL = (
+        'http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument'
+    )
+    UPLOAD_WORKERS = 16   # Eşzamanlı Cloudinary yükleme sayısı
+    GORSEL_PENCERESI = 2 * UPLOAD_WORKERS   # Aynı anda bellekte tutulan görsel sayısı
+    _QN_BODY    = qn('w:body')
+    _QN_P       = qn('w:p')
+    _QN_TBL     = qn('w:tbl')
+    _QN_SDT     = qn('w:sdt')
+    _QN_T       = qn('w:t')
+    _QN_DRAWING = qn('w:drawing')
+    _QN_BLIP    = qn('a:blip')
+    _FIYAT_RE   = re.compile(r'\d[\d\.,]+\s*(TL|₺)', re.IGNORECASE)
 
-    @staticmethod
-    def _is_fiyat(text: str) -> bool:
-        return bool(re.search(r'\d[\d\.,]+\s*(TL|₺)', text, re.IGNORECASE))
+    @classmethod
+    def _is_fiyat(cls, text: str) -> bool:
+        # Ucuz ön kontrol: para birimi yoksa regex motoruna hiç girilmez
+        if "₺" not in text and "TL" not in text.upper():
+            return False
+        return bool(cls._FIYAT_RE.search(text))
+
+    @classmethod
+    def _read_rels(cls, zf, part_name: str) -> list:
+        """
+        Bir part'ın .rels dosyasını (rId, tip, ZIP içi hedef yol) listesine çevir.
+        part_name="" → paket düzeyindeki _rels/.rels okunur.
+        """
+        base, name = posixpath.split(part_name)
+        root = etree.fromstring(zf.read(posixpath.join(base, "_rels", name + ".rels")))
+        rels = []
+        for rel in root.iter(cls._REL_NS + "Relationship"):
+            if rel.get("TargetMode") == "External":
+                continue
+            target = rel.get("Target", "")
+            if target.startswith("/"):
+                path = target.lstrip("/")
+            else:
+                path = posixpath.normpath(posixpath.join(base, target))
+            rels.append((rel.get("Id"), rel.get("Type"), path))
+        return rels
+
+    @classmethod
+    def _node(cls, elem, rels: dict) -> dict:
+        """
+        Body'nin bir doğrudan çocuğundan {"text", "is_img", "ref"} node'u üret.
+        Metin, görsel ve blip tek bir alt ağaç gezintisinde birlikte toplanır;
+        rels → rId'den ZIP içi görsel yoluna eşleme. İki parse yolu da bunu kullanır.
+        """
+        text_parts = []
+        is_img     = False
+        ref        = None
+        for e in elem.iter(cls._QN_T, cls._QN_DRAWING, cls._QN_BLIP):
+            tag = e.tag
+            if tag == cls._QN_T:
+                if e.text:
+                    text_parts.append(e.text)
+            elif tag == cls._QN_DRAWING:
+                is_img = True
+            elif ref is None:
+                ref = rels.get(e.get(cls._BLIP_ATTR))
+        return {"text": ''.join(text_parts).strip(), "is_img": is_img, "ref": ref}
+
+    @classmethod
+    def _main_part(cls, zf) -> str:
+        """Paket rels'inden ana doküman part'ının ZIP içi yolunu bul; yoksa KeyError."""
+        main_part = next(
+            (path for _, rel_type, path in cls._read_rels(zf, "")
+             if rel_type == cls._OFFICE_DOCUMENT_REL),
+            None,
+        )
+        if main_part is None:
+            raise KeyError("officeDocument ilişkisi bulunamadı")
+        return main_part
 
     @classmethod
-    def _extract_image_bytes(cls, para_elem, doc_part):
-        """Paragraf elementinden embed görsel byte'larını çıkar."""
-        blips = para_elem.findall('.//' + qn('a:blip'))
-        if not blips:
-            return None
-        rId = blips[0].get(cls._BLIP_ATTR)
-        if not rId or rId not in doc_part.rels:
-            return None
+    def _iter_xml_nodes(cls, zf, main_part: str):
+        """
+        Ana doküman XML'ini lxml iterparse ile akış halinde oku; body'nin her
+        doğrudan çocuğu için {"text", "is_img", "ref"} node'u üret.
+        İşlenen elementler hemen silinir; bellek kullanımı doküman boyutundan bağımsızdır.
+        """
+        rels = {rId: path for rId, _, path in cls._read_rels(zf, main_part)}
+
+        with zf.open(main_part) as stream:
+            for _, elem in etree.iterparse(
+                stream, events=("end",), tag=(cls._QN_P, cls._QN_TBL, cls._QN_SDT)
+            ):
+                parent = elem.getparent()
+                # Tablo / içerik kontrolü içindeki paragraflar üst elementle birlikte işlenir
+                if parent is None or parent.tag != cls._QN_BODY:
+                    continue
+
+                yield cls._node(elem, rels)
+
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del parent[0]
+
+    @classmethod
+    def _iter_docx_nodes(cls, doc: Document):
+        """python-docx DOM'u üzerinden aynı node'ları üret (yedek yol)."""
+        # rId → ZIP içi yol eşlemesi bir kez kurulur; paragraf başına rels araması yapılmaz
+        rels = {
+            rId: rel.target_part.partname.lstrip("/")
+            for rId, rel in doc.part.rels.items()
+            if not rel.is_external
+        }
+        for child in doc.element.body:
+            yield cls._node(child, rels)
+
+    @classmethod
+    def parse_docx(cls, file_bytes: bytes) -> tuple:
+        """
+        .docx byte'larını parse et; (eserler, gorsel_yollari) döndür.
+
+        Önce word/document.xml doğrudan ZIP'ten akış halinde okunur; beklenmedik
+        bir paket yapısında python-docx ile tam DOM kurularak parse edilir.
+        """
         try:
-            return doc_part.rels[rId].target_part.blob
-        except Exception:
-            return None
+            with zipfile.ZipFile(io.BytesIO(file_bytes)) as zf:
+                # Ana part generator başlamadan çözülür; generator içinden kaçan
+                # StopIteration RuntimeError'a dönüşür (PEP 479) ve yedek yol atlanırdı
+                main_part = cls._main_part(zf)
+                return cls._build_artworks(cls._iter_xml_nodes(zf, main_part))
+        except (KeyError, etree.XMLSyntaxError):
+            return cls.parse(Document(io.BytesIO(file_bytes)))
 
     @classmethod
-    def parse(cls, doc: Document, upload_images: bool = False,
-              progress_callback=None) -> list:
+    def parse(cls, doc: Document) -> tuple:
+        """
+        Document nesnesini parse et; (eserler, gorsel_yollari) döndür.
         """
-        Document nesnesini parse et; eser listesi döndür.
+        return cls._build_artworks(cls._iter_docx_nodes(doc))
+
+    @classmethod
+    def _build_artworks(cls, nodes) -> tuple:
+        """
+        Node akışından eserleri çıkar; (eserler, gorsel_yollari) döndür.
 
         Görsel paragrafı → hemen arkasındaki ilk dolu satır sahip olarak alınır.
         Bu yaklaşım sahip satırındaki tüm format farklılıklarını kapsar.
 
-        upload_images=True    → görselleri Cloudinary'e yükler ve gorsel_url ekler.
-        upload_images=False   → gorsel_url boş kalır (hızlı önizleme).
-        progress_callback     → her eser işlenince callback(done, total) çağrılır.
-                                 İlk geçişte total bilinmediği için None geçilebilir.
-        """
-        body_children = list(doc.element.body)
-        doc_part      = doc.part
-
-        nodes = []
-        for child in body_children:
-            texts  = child.findall('.//' + qn('w:t'))
-            text   = ''.join(t.text or '' for t in texts).strip()
-            is_img = bool(child.findall('.//' + qn('w:drawing')))
-            nodes.append({"elem": child, "text": text, "is_img": is_img})
-
-        # Toplam eser sayısını önceden hesapla (progress için)
-        toplam_eser = sum(
-            1 for idx, nd in enumerate(nodes)
-            if nd["is_img"] and idx + 1 < len(nodes)
-        )
+        nodes herhangi bir iterable olabilir; tek node'luk ileri bakışla
+        işlendiği için node listesi bellekte tutulmaz.
 
+        gorsel_yollari[i] → eserler[i] görselinin .docx ZIP'i içindeki yolu (yoksa None).
+        Ağ I/O'su yapılmaz; gorsel_url boş kalır. Görseller gerektiğinde
+        upload_images ile, metin tekrar parse edilmeden yüklenir.
+        """
         artworks    = []
-        lot_counter = 0
-        i           = 0
+        image_refs  = []
 
-        while i < len(nodes):
-            node = nodes[i]
+        it   = iter(nodes)
+        node = next(it, None)
 
+        while node is not None:
             if not node["is_img"]:
-                i += 1
+                node = next(it, None)
                 continue
 
-            img_elem = node["elem"]
+            img_node = node
 
             # Görsel sonrası ilk anlamlı node'u bul
-            j = i + 1
-            while j < len(nodes) and not nodes[j]["text"] and not nodes[j]["is_img"]:
-                j += 1
+            node = next(it, None)
+            while node is not None and not node["text"] and not node["is_img"]:
+                node = next(it, None)
 
             # Sonraki anlamlı node başka bir görsel ise bu görsel başlıksız, atla
-            if j >= len(nodes) or nodes[j]["is_img"]:
-                i += 1
+            if node is None or node["is_img"]:
                 continue
 
-            lot_counter += 1
-            sahip = nodes[j]["text"]
+            sahip = node["text"]
 
-            # Devamındaki satırları topla (bir sonraki görsele kadar)
+            # Devamındaki satırları topla (bir sonraki görsele kadar);
+            # art arda iki boş satır bloğu bitirir
             lines = []
-            k = j + 1
-            while k < len(nodes) and len(lines) < 6:
-                if nodes[k]["is_img"]:
+            node  = next(it, None)
+            while node is not None and len(lines) < 6:
+                if node["is_img"]:
+                    break
+                if node["text"]:
+                    lines.append(node["text"])
+                    node = next(it, None)
+                    continue
+                node = next(it, None)
+                if node is not None and not node["text"]:
                     break
-                t = nodes[k]["text"]
-                if t:
-                    lines.append(t)
-                else:
-                    if k + 1 < len(nodes) and not nodes[k + 1]["text"]:
-                        break
-                k += 1
 
             sanatci  = lines[0] if len(lines) > 0 else ""
             eser_adi = lines[1] if len(lines) > 1 else ""
@@ -333,47 +668,151 @@ class MuzayedeParser:
                     satis_fiyati = ln
                     break
 
-            gorsel_url = ""
-            if upload_images:
-                img_bytes = cls._extract_image_bytes(img_elem, doc_part)
-                if img_bytes:
-                    public_id = f"lot_{lot_counter}"
-                    try:
-                        gorsel_url = CloudinaryService.upload(img_bytes, public_id)
-                    except Exception as e:
-                        st.warning(f"Lot {lot_counter} görseli yüklenemedi: {e}")
-
             artworks.append({
-                "lot_no":       lot_counter,
+                # Lot numarası eserin belgedeki sırasıdır
+                "lot_no":       len(artworks) + 1,
                 "sahip":        sahip,
                 "sanatci":      sanatci,
                 "eser_adi":     eser_adi,
                 "detay":        detay,
-                "gorsel_url":   gorsel_url,
+                "gorsel_url":   "",
                 "satis_fiyati": satis_fiyati,
             })
+            image_refs.append(img_node["ref"])
 
-            if progress_callback:
-                progress_callback(lot_counter, toplam_eser)
+        return artworks, image_refs
 
-            i = k
+    @classmethod
+    def upload_images(cls, artworks: list, image_refs: list, file_bytes: bytes,
+                      progress_callback=None):
+        """
+        parse_docx() çıktısındaki görselleri .docx ZIP'inden okuyup paralel olarak
+        Cloudinary'e yükle, artworks içindeki gorsel_url alanlarını yerinde doldur.
+
+        Generator: eserler lot sırasıyla, önlerindeki tüm lotların görselleri
+        tamamlanır tamamlanmaz yield edilir; çağıran taraf yüklemeler sürerken
+        eserleri veritabanına lot sırasını bozmadan yazabilir.
+
+        Yüklemeler I/O-bound olduğundan thread havuzu yeterli; st.* çağrıları
+        worker thread'lerde çalışmadığı için sonuçlar ana thread'de işlenir.
+        progress_callback → her eser tamamlanınca callback(done, total) çağrılır.
+        """
+        # SDK yapılandırması ve HTTP havuzu iş gönderilmeden, script thread'inde kurulur
+        CloudinaryService._configure()
+
+        with zipfile.ZipFile(io.BytesIO(file_bytes)) as zf:
+            uyeler   = set(zf.namelist())
+            bekleyen = [
+                (idx, ref) for idx, ref in enumerate(image_refs) if ref in uyeler
+            ]
+
+            toplam = len(artworks)
+            done   = toplam - len(bekleyen)
+
+            # hazir[i] → i. eser yazılmaya hazır; sira → sıradaki yield edilecek eser
+            gorselli = {idx for idx, _ in bekleyen}
+            hazir    = [idx not in gorselli for idx in range(toplam)]
+            sira     = 0
+
+            def sirayla_hazir():
+                # Tamamlanan ön ek kadar ilerler; sonraki lot beklerse arkası bekletilir
+                nonlocal sira
+                baslangic = sira
+                while sira < toplam and hazir[sira]:
+                    sira += 1
+                return artworks[baslangic:sira]
+
+            yield from sirayla_hazir()
+
+            # Görsel byte'ları gönderim anında okunur; bellekte en fazla
+            # GORSEL_PENCERESI kadar görsel bulunur, tüm katalog değil
+            kuyruk = iter(bekleyen)
+            with ThreadPoolExecutor(max_workers=cls.UPLOAD_WORKERS) as executor:
+                futures = {}
+
+                def tamamla(idx):
+                    nonlocal done
+                    hazir[idx] = True
+                    done += 1
+                    if progress_callback:
+                        progress_callback(done, toplam)
+
+                def gonder():
+                    for idx, ref in kuyruk:
+                        # Bozuk bir medya üyesi (CRC, desteklenmeyen sıkıştırma) tüm
+                        # yüklemeyi durdurmaz; o eser görselsiz eklenir
+                        try:
+                            gorsel = zf.read(ref)
+                        except Exception as e:
+                            st.warning(
+                                f"Lot {artworks[idx]['lot_no']} görseli okunamadı: {e}"
+                            )
+                            tamamla(idx)
+                            continue
+                        future = executor.submit(
+                            CloudinaryService.upload,
+                            gorsel,
+                            f"lot_{artworks[idx]['lot_no']}",
+                        )
+                        futures[future] = idx
+                        if len(futures) >= cls.GORSEL_PENCERESI:
+                            break
+
+                gonder()
+                yield from sirayla_hazir()
+                while futures:
+                    tamamlanan, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in tamamlanan:
+                        idx     = futures.pop(future)
+                        artwork = artworks[idx]
+                        try:
+                            artwork["gorsel_url"] = future.result()
+                        except Exception as e:
+                            st.warning(f"Lot {artwork['lot_no']} görseli yüklenemedi: {e}")
+                        tamamla(idx)
+                    gonder()
+                    yield from sirayla_hazir()
+
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def _parse_docx(file_hash: str, _file_bytes: bytes):
+    """
+    Dosya içeriğinin hash'ine göre parse sonucunu (eserler, gorsel_yollari) sakla.
+    Rerun'larda ve yükleme adımında .docx tekrar açılıp parse edilmez.
+    """
+    return MuzayedeParser.parse_docx(_file_bytes)
 
-        return artworks
 
 # ==================== PRESENTATION LAYER ====================
 
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _load_logo(path: str, mtime: float):
+    """
+    Logo byte'larını bir kez oku; dosya yoksa None.
+    mtime → dosya değişince süreç yeniden başlatılmadan yeni logo okunur.
+    """
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
 class LoginView:
     def __init__(self, auth_service):
         self.auth_service = auth_service
 
     def render(self):
         # Logo varsa st.image ile göster (unsafe_allow_html gerektirmez)
-        logo_path = "logo.png"
-        if os.path.exists(logo_path):
+        try:
+            logo = _load_logo("logo.png", os.path.getmtime("logo.png"))
+        except OSError:
+            logo = None
+        if logo:
             try:
                 col1, col2, col3 = st.columns([1, 2, 1])
                 with col2:
-                    st.image(logo_path, width='stretch')
+                    st.image(logo, width='stretch')
             except Exception:
                 pass
 
@@ -394,8 +833,6 @@ class LoginView:
                 if submitted and access_code:
                     if self.auth_service.verify_code(access_code):
                         SessionManager.login()
-                        st.success("✅ Giriş başarılı!")
-                        time.sleep(0.5)
                         st.rerun()
                     else:
                         st.error("❌ Hatalı erişim kodu!")
@@ -405,6 +842,10 @@ class LoginView:
 class MainView:
     GOSTERIM_LIMITI = 2000
     KART_KOLONLARI  = 4   # Arama sonuçlarında yan yana kaç kart
+    ARAMA_ALANLARI  = ("eser_adi", "sanatci", "sahip", "detay")
+    TABLO_KOLONLARI = ["lot_no", "eser_adi", "sanatci", "sahip"]
+    EKLEME_TAMPONU  = 500   # Yükleme sırasında kaç eserde bir veritabanına yazılır
+    _TEXT_ARAMA_RE  = re.compile(r"[\w\s]+")   # Sadece harf/rakam/boşluk → $text
 
     def __init__(self, eserler_repo):
         self.eserler_repo = eserler_repo
@@ -422,14 +863,22 @@ class MainView:
     def _render_header(self):
         col1, col2, col3 = st.columns([6, 1, 1])
         with col2:
-            remaining = SessionManager.get_remaining_time()
-            st.caption(f"⏱️ Kalan: {int(remaining.total_seconds() // 60)} dk")
+            self._render_countdown()
         with col3:
             if st.button("🚪 Çıkış"):
                 SessionManager.logout()
                 st.rerun()
         st.title("🏛️")
 
+    @st.fragment(run_every="60s")
+    def _render_countdown(self):
+        # Dakikada bir yalnızca bu parça yenilenir; arama ve tablo yeniden çalışmaz
+        remaining = SessionManager.get_remaining_time()
+        if remaining <= timedelta(0) and st.session_state.get("login_time"):
+            # Süre doldu; tam rerun'da check_timeout oturumu kapatır
+            st.rerun(scope="app")
+        st.caption(f"⏱️ Kalan: {int(remaining.total_seconds() // 60)} dk")
+
     def _render_sidebar(self):
         st.sidebar.header("📤 Eser Dosyası Yükleme")
         st.sidebar.caption(
@@ -457,15 +906,25 @@ class MainView:
         if yukleniyor:
             st.sidebar.info("⏳ Yükleme devam ediyor, lütfen bekleyin...")
 
+    @staticmethod
+    def _dosya_hash(file_bytes: bytes) -> str:
+        """Parse önbelleği için içerik anahtarı; blake2b SHA-1'den hızlıdır."""
+        return hashlib.blake2b(file_bytes, digest_size=16).hexdigest()
+
     def _handle_file_upload(self, uploaded_file, gorsel_yukle: bool):
         try:
-            file_key = f"docx_bytes_{uploaded_file.name}"
-            if file_key not in st.session_state:
-                st.session_state[file_key] = uploaded_file.read()
-
-            file_bytes = io.BytesIO(st.session_state[file_key])
-            doc = Document(file_bytes)
-            kayitlar = MuzayedeParser.parse(doc, upload_images=False)
+            # Session'da tek dosya tutulur; yeni dosya seçilince eskisinin byte'ları bırakılır
+            if st.session_state.get("docx_id") != uploaded_file.file_id:
+                file_bytes = uploaded_file.read()
+                st.session_state["docx_id"]    = uploaded_file.file_id
+                st.session_state["docx_adi"]   = uploaded_file.name
+                st.session_state["docx_bytes"] = file_bytes
+                # Hash dosya başına bir kez hesaplanır; rerun'larda session'dan okunur
+                st.session_state["docx_hash"]  = self._dosya_hash(file_bytes)
+
+            kayitlar, _ = _parse_docx(
+                st.session_state["docx_hash"], st.session_state["docx_bytes"]
+            )
 
             if not kayitlar:
                 st.sidebar.warning(
@@ -488,73 +947,138 @@ class MainView:
 
     def _do_upload(self):
         """Yükleme işlemini gerçekleştir — yukleniyor=True olduğunda çağrılır."""
-        # Hangi dosya key'i var?
-        file_key = next(
-            (k for k in st.session_state if k.startswith("docx_bytes_")), None
-        )
-        if not file_key:
+        if "docx_bytes" not in st.session_state:
             st.session_state["yukleniyor"] = False
             return
 
-        dosya_adi = file_key.replace("docx_bytes_", "")
+        dosya_adi = st.session_state["docx_adi"]
         gorsel_yukle = st.session_state.get("gorsel_yukle_tercih", True)
 
+        # Veritabanına gönderilen eserler; yükleme yarıda kalırsa geri alınır
+        yazilan = []
+
         try:
             t_baslangic = time.perf_counter()
             with st.sidebar:
-                fresh_bytes = io.BytesIO(st.session_state[file_key])
-                doc = Document(fresh_bytes)
-
-                kayitlar_on = MuzayedeParser.parse(doc, upload_images=False)
+                file_bytes = st.session_state["docx_bytes"]
+                kayitlar_on, image_refs = _parse_docx(
+                    st.session_state["docx_hash"], file_bytes
+                )
                 toplam = len(kayitlar_on)
 
                 st.markdown("**Eserler yükleniyor...**")
                 progress_bar = st.progress(0)
                 durum_yazisi = st.empty()
 
-                fresh_bytes2 = io.BytesIO(st.session_state[file_key])
-                doc2 = Document(fresh_bytes2)
-                kayitlar = MuzayedeParser.parse(
-                    doc2,
-                    upload_images=gorsel_yukle,
-                    progress_callback=lambda done, total: (
-                        progress_bar.progress(done / total),
-                        durum_yazisi.caption(f"{done} / {total} eser işlendi")
+                # Önbellekteki liste paylaşımlı; gorsel_url / _id yazılacağı için kopyala
+                kayitlar = [dict(k, dosya_adi=dosya_adi) for k in kayitlar_on]
+
+                if gorsel_yukle:
+                    eserler = MuzayedeParser.upload_images(
+                        kayitlar,
+                        image_refs,
+                        file_bytes,
+                        progress_callback=lambda done, total: (
+                            progress_bar.progress(done / total),
+                            durum_yazisi.caption(f"{done} / {total} eser işlendi")
+                        )
                     )
-                )
+                else:
+                    eserler = kayitlar
+
+                # Görseli biten eserler tampon dolduğunda yazılır; kalan yüklemeler
+                # worker thread'lerde sürerken veritabanı ekleme de ilerler
+                eklenen = 0
+                tampon  = []
+                for eser in eserler:
+                    tampon.append(eser)
+                    if len(tampon) >= self.EKLEME_TAMPONU:
+                        yazilan.extend(tampon)
+                        eklenen += self.eserler_repo.insert_many(tampon)
+                        tampon = []
+                yazilan.extend(tampon)
+                eklenen += self.eserler_repo.insert_many(tampon)
+
                 progress_bar.progress(1.0)
                 durum_yazisi.caption(f"{toplam} / {toplam} eser işlendi")
 
-            for k in kayitlar:
-                k["dosya_adi"] = dosya_adi
-
-            self.eserler_repo.insert_many(kayitlar)
+            _cached_search.clear()
+            _cached_sanatcilar.clear()
             sure_toplam = time.perf_counter() - t_baslangic
 
-            st.sidebar.success(f"✅ {len(kayitlar)} eser {sure_toplam:.2f} sn'de eklendi.")
-            del st.session_state[file_key]
+            st.sidebar.success(f"✅ {eklenen} eser {sure_toplam:.2f} sn'de eklendi.")
+            if eklenen < len(kayitlar):
+                st.sidebar.warning(f"{len(kayitlar) - eklenen} eser eklenemedi.")
+            self._clear_docx()
 
         except Exception as e:
             st.sidebar.error(f"Hata: {e}")
+            self._rollback_upload(yazilan)
         finally:
             st.session_state["yukleniyor"] = False
             st.rerun()
 
-    def _render_search(self):
-        col1, col2, col3 = st.columns([3, 1, 1])
-        with col1:
-            search_query = st.text_input(
-                "Anahtar kelime (eser adı, sanatçı, sahip, detay)",
-                placeholder="Örn. Ertuğrul Ateş, yağlıboya, Levent Gürel..."
+    @staticmethod
+    def _clear_docx():
+        """Seçili .docx dosyasını oturumdan kaldır."""
+        for key in ("docx_id", "docx_adi", "docx_bytes", "docx_hash"):
+            st.session_state.pop(key, None)
+
+    def _rollback_upload(self, yazilan):
+        """
+        Yarıda kalan yüklemede tampon tampon yazılmış eserleri sil; dosya tekrar
+        eklendiğinde lotlar çiftlenmez. Silme de başarısız olursa yazılan sayı
+        bildirilir ve dosya seçimi temizlenir, tekrar ekleme çift kayıt üretirdi.
+        """
+        # pymongo _id'yi gönderdiği dokümana yerinde ekler; _id'siz olanlar hiç gitmedi
+        eser_idler = [eser["_id"] for eser in yazilan if "_id" in eser]
+        if not eser_idler:
+            return
+        _cached_search.clear()
+        _cached_sanatcilar.clear()
+        try:
+            silinen = self.eserler_repo.delete_by_ids(eser_idler)
+            st.sidebar.warning(
+                f"Yarıda kalan yüklemede eklenen {silinen} eser geri alındı; "
+                f"dosya tekrar eklenebilir."
             )
-        with col2:
-            lot_no_query = st.text_input("Lot No", placeholder="Örn. 37")
-        with col3:
-            sanatci_liste = [""] + self.eserler_repo.get_distinct_sanatcilar()
-            sanatci_filtre = st.selectbox("Sanatçıya göre filtrele", sanatci_liste)
+        except Exception as e:
+            st.sidebar.error(
+                f"En fazla {len(eser_idler)} eser veritabanına yazıldı ancak geri "
+                f"alınamadı: {e}"
+            )
+            self._clear_docx()
 
-        sorgu = self._build_query(search_query, lot_no_query, sanatci_filtre)
-        self._show_results(sorgu)
+    def _render_search(self):
+        # Gönderilmiş form değerleri widget'lar çizilmeden session_state'te hazırdır;
+        # arama arka planda başlar, sanatçı listesi sorgusuyla aynı anda yürür.
+        # Her rerun kendi thread'ini açar; ortak bir havuz eşzamanlı oturumları
+        # işçi sayısında sıraya sokardı. Bağlantı sınırını MongoClient havuzu belirler.
+        ss    = st.session_state
+        sorgu = self._build_query(
+            ss.get("arama_kelime", ""), ss.get("arama_lot", ""), ss.get("arama_sanatci", "")
+        )
+        executor = ThreadPoolExecutor(max_workers=1)
+        sonuc    = executor.submit(self._fetch_results, sorgu)
+        executor.shutdown(wait=False)
+
+        # Form içindeki alanlar tuş vuruşunda rerun tetiklemez; sorgu Enter / Ara ile gider
+        with st.form("arama_formu", border=False):
+            col1, col2, col3 = st.columns([3, 1, 1])
+            with col1:
+                st.text_input(
+                    "Anahtar kelime (eser adı, sanatçı, sahip, detay)",
+                    placeholder="Örn. Ertuğrul Ateş, yağlıboya, Levent Gürel...",
+                    key="arama_kelime",
+                )
+            with col2:
+                st.text_input("Lot No", placeholder="Örn. 37", key="arama_lot")
+            with col3:
+                sanatci_liste = [""] + _cached_sanatcilar(self.eserler_repo.estimated_count())
+                st.selectbox("Sanatçıya göre filtrele", sanatci_liste, key="arama_sanatci")
+            st.form_submit_button("Ara")
+
+        self._show_results(sorgu, sonuc)
 
     def _build_query(self, search_query, lot_no_query, sanatci_filtre):
         sorgu = {}
@@ -565,52 +1089,106 @@ class MainView:
             except ValueError:
                 pass
 
-        if search_query:
-            sorgu["$or"] = [
-                {"eser_adi": {"$regex": search_query, "$options": "i"}},
-                {"sanatci":  {"$regex": search_query, "$options": "i"}},
-                {"sahip":    {"$regex": search_query, "$options": "i"}},
-                {"detay":    {"$regex": search_query, "$options": "i"}},
-            ]
+        aranan = search_query.strip()
+        if aranan:
+            if self._TEXT_ARAMA_RE.fullmatch(aranan):
+                sorgu["$text"] = {"$search": aranan}
+            else:
+                # Noktalama / özel karakter içeren aramalar text index'e uygun değil
+                sorgu["$or"] = self._prefix_clauses(aranan)
 
         if sanatci_filtre:
             sorgu["sanatci"] = sanatci_filtre
 
         return sorgu
 
-    def _show_results(self, sorgu):
+    @classmethod
+    def _prefix_clauses(cls, aranan):
+        """Her arama alanı için başa sabitlenmiş (^), büyük/küçük harf duyarsız regex."""
+        desen = "^" + re.escape(aranan)
+        return [{alan: {"$regex": desen, "$options": "i"}} for alan in cls.ARAMA_ALANLARI]
+
+    @classmethod
+    def _build_prefix_query(cls, sorgu):
+        """
+        $text sadece tam kelimeleri eşleştirir ("Ertu" → "Ertuğrul" bulunmaz).
+        Sonuç çıkmazsa alan başına sabitlenmiş (^) regex ile tekrar denenir.
+        """
+        yedek = {k: v for k, v in sorgu.items() if k != "$text"}
+        yedek["$or"] = cls._prefix_clauses(sorgu["$text"]["$search"])
+        return yedek
+
+    @classmethod
+    def _fetch_results(cls, sorgu):
+        """Worker thread'de çalışır; st.* çağrısı yapmaz, sadece veriyi getirir."""
+        # Limitin bir fazlası istenir; böylece sonuçların kesilip kesilmediği bilinir
+        limit = cls.GOSTERIM_LIMITI + 1
+        items = _cached_search(json.dumps(sorgu, sort_keys=True), limit)
+        if not items and "$text" in sorgu:
+            items = _cached_search(
+                json.dumps(cls._build_prefix_query(sorgu), sort_keys=True), limit
+            )
+        return items
+
+    def _show_results(self, sorgu, sonuc):
         try:
-            items = self.eserler_repo.search(sorgu)
+            items = sonuc.result()
         except Exception as e:
             st.error(f"Veritabanı hatası: {e}")
             items = []
 
         toplam = len(items)
-        st.subheader(f"🔍 {toplam:,} Eserde Ara" if toplam else "🔍 Eserlerde Ara")
+        if toplam > self.GOSTERIM_LIMITI:
+            st.subheader(f"🔍 {self.GOSTERIM_LIMITI:,}+ Eserde Ara")
+        else:
+            st.subheader(f"🔍 {toplam:,} Eserde Ara" if toplam else "🔍 Eserlerde Ara")
 
         if items:
-            self._display_results(items)
+            self._display_results(items, json.dumps(sorgu, sort_keys=True))
         else:
             st.info(
                 "Sonuç bulunamadı. Sol taraftan .docx dosyası yükleyip "
                 "'Eserleri Veritabanına Ekle' ile havuzu doldurun."
             )
 
-    def _display_results(self, items):
+    def _display_results(self, items, sorgu_key):
         toplam = len(items)
         if toplam > self.GOSTERIM_LIMITI:
-            st.info(f"İlk **{self.GOSTERIM_LIMITI}** kayıt gösteriliyor (toplam {toplam}).")
+            st.info(f"İlk **{self.GOSTERIM_LIMITI}** kayıt gösteriliyor; aramayı daraltın.")
             items = items[:self.GOSTERIM_LIMITI]
 
-        # Seçili eser varsa dialog aç
-        if st.session_state.get("secili_eser") is not None:
-            self._render_dialog(st.session_state["secili_eser"])
+        # Tablo tek bir Arrow mesajı olarak gönderilir; satır başına widget oluşmaz.
+        # Anahtar sorguya ve dialog sayacına bağlı: ikisi değişince seçim sıfırlanır.
+        surum = st.session_state.get("tablo_surum", 0)
+        olay = st.dataframe(
+            pd.DataFrame(items, columns=self.TABLO_KOLONLARI),
+            hide_index     = True,
+            column_config  = {
+                "lot_no":   st.column_config.NumberColumn("Lot", format="%d"),
+                "eser_adi": "Eser Adı",
+                "sanatci":  "Sanatçı",
+                "sahip":    "Sahip",
+            },
+            key            = f"eser_tablo_{surum}_{sorgu_key}",
+            on_select      = "rerun",
+            selection_mode = "single-row",
+        )
+        if olay.selection.rows:
+            self._render_dialog(items[olay.selection.rows[0]])
 
-        self._render_list(items)
+    @staticmethod
+    def _secimi_sifirla():
+        # Dataframe seçimi yazılamaz; anahtar değiştirilerek tablo temiz başlar
+        st.session_state["tablo_surum"] = st.session_state.get("tablo_surum", 0) + 1
 
-    @st.dialog("Eser Detayı", width="large")
+    @st.dialog("Eser Detayı", width="large", on_dismiss=_secimi_sifirla)
     def _render_dialog(self, item):
         """st.dialog ile native modal — kapat butonu otomatik gelir."""
+        # Liste yalnızca özet alanları taşır; detay alanları tek dokümandan okunur
+        try:
+            item = self.eserler_repo.get_detail(item["_id"]) or item
+        except Exception as e:
+            st.error(f"Veritabanı hatası: {e}")
         gorsel_url = item.get("gorsel_url", "")
         lot  = item.get("lot_no", "")
         ad   = item.get("eser_adi") or "—"
@@ -620,8 +1198,10 @@ class MainView:
         dosya = item.get("dosya_adi") or ""
 
         if gorsel_url:
+            src = html.escape(CloudinaryService.delivery_url(gorsel_url), quote=True)
             st.markdown(
-                f"<img src='{gorsel_url}' style='max-width:100%;border-radius:8px;"
+                f"<img src='{src}' loading='lazy' decoding='async' "
+                f"style='max-width:100%;border-radius:8px;"
                 f"display:block;margin:0 auto 1rem;'/>",
                 unsafe_allow_html=True
             )
@@ -638,38 +1218,26 @@ class MainView:
         col2.markdown(f"<small style='color:#888'>{dosya}</small>", unsafe_allow_html=True)
 
         if st.button("Kapat", use_container_width=False):
-            st.session_state["secili_eser"] = None
+            self._secimi_sifirla()
             st.rerun()
 
-    def _render_list(self, items):
-        """Satır satır liste görünümü."""
-        h1, h2, h3, h4, h5 = st.columns([1, 4, 3, 3, 2])
-        h1.markdown("**Lot**")
-        h2.markdown("**Eser Adı**")
-        h3.markdown("**Sanatçı**")
-        h4.markdown("**Sahip**")
-        h5.markdown("")
-        st.divider()
 
-        for idx, item in enumerate(items):
-            c1, c2, c3, c4, c5 = st.columns([1, 4, 3, 3, 2])
-            c1.write(item.get("lot_no", ""))
-            c2.write(item.get("eser_adi") or "—")
-            c3.write(item.get("sanatci") or "—")
-            c4.write(item.get("sahip") or "—")
-            if c5.button("Detay", key=f"detay_{idx}"):
-                st.session_state["secili_eser"] = item
-                st.rerun()
+# ==================== APPLICATION ====================
 
+@st.cache_resource(show_spinner=False)
+def _build_services():
+    """
+    Servis ve repository nesneleri durumsuzdur; süreç başına bir kez kurulur.
+    Rerun'larda secrets okuma ve bağlantı çözümleme tekrarlanmaz.
+    """
+    return AuthenticationService(), EserlerRepository()
 
-# ==================== APPLICATION ====================
 
 class Application:
     def __init__(self):
         self._setup_page()
         SessionManager.initialize()
-        self.auth_service = AuthenticationService()
-        self.eserler_repo = EserlerRepository()
+        self.auth_service, self.eserler_repo = _build_services()
         self.login_view = LoginView(self.auth_service)
         self.main_view = MainView(self.eserler_repo)
 
@@ -681,9 +1249,18 @@ class Application:
             page_icon="favicon.png" if os.path.exists("favicon.png") else "logo.png",
         )
 
+    def _check_indexes(self):
+        # Giriş ekranı veritabanına bağlı değildir; index'ler yalnızca oturum açıldıktan sonra kurulur
+        gorev = _ensure_indexes(self.eserler_repo)
+        if gorev.done() and gorev.exception() is not None:
+            # Hata önbellekte kalmasın; bir sonraki rerun'da yeniden denenir
+            _ensure_indexes.clear()
+            st.warning(f"Veritabanı index'leri oluşturulamadı: {gorev.exception()}")
+
     def run(self):
         SessionManager.check_timeout()
         if SessionManager.is_authenticated():
+            self._check_indexes()
             self.main_view.render()
         else:
             self.login_view.render()